@@ -0,0 +1,80 @@
+"""
+pyart.graph._aeqd_fast
+======================
+
+Cython routine for the inverse azimuthal equidistant transform used by
+the radar map displays when Numba is not available.
+
+.. autosummary::
+    :toctree: generated/
+
+    aeqd_inverse
+
+"""
+
+from libc.math cimport sqrt, sin, cos, asin, atan2
+
+cimport cython
+
+cdef double PI = 3.14159265358979323846
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def aeqd_inverse(double[::1] x, double[::1] y, double lat_0, double lon_0,
+                 double R, double[::1] lon, double[::1] lat):
+    """
+    Inverse azimuthal equidistant transform for a fixed projection center.
+
+    Computes the same transform as
+    :py:func:`pyart.core.transforms.cartesian_to_geographic_aeqd` with the
+    results written into preallocated output arrays.
+
+    Parameters
+    ----------
+    x, y : 1D array of float64
+        Cartesian coordinates in the same units as R, typically meters.
+    lat_0, lon_0 : double
+        Latitude and longitude, in degrees, of the center of the
+        projection.
+    R : double
+        Earth radius in the same units as x and y.
+    lon, lat : 1D array of float64
+        Output arrays which are filled with the longitude and latitude,
+        in degrees, of the input coordinates.
+
+    """
+    cdef int i
+    cdef int npts = x.shape[0]
+    cdef double deg2rad = PI / 180.
+    cdef double rad2deg = 180. / PI
+    cdef double lat_0_rad = lat_0 * deg2rad
+    cdef double lon_0_rad = lon_0 * deg2rad
+    cdef double sin_lat_0 = sin(lat_0_rad)
+    cdef double cos_lat_0 = cos(lat_0_rad)
+    cdef double rho, c, sin_c, cos_c, lon_deg
+
+    with nogil:
+        for i in range(npts):
+            rho = sqrt(x[i] * x[i] + y[i] * y[i])
+            if rho == 0.:
+                # the center of the projection
+                lon[i] = lon_0
+                lat[i] = lat_0
+                continue
+            c = rho / R
+            sin_c = sin(c)
+            cos_c = cos(c)
+            lat[i] = rad2deg * asin(
+                cos_c * sin_lat_0 + y[i] * sin_c * cos_lat_0 / rho)
+            lon_deg = rad2deg * (lon_0_rad + atan2(
+                x[i] * sin_c,
+                rho * cos_lat_0 * cos_c - y[i] * sin_lat_0 * sin_c))
+            # longitudes should be from -180 to 180 degrees
+            if lon_deg > 180.:
+                lon_deg -= 360.
+            elif lon_deg < -180.:
+                lon_deg += 360.
+            lon[i] = lon_deg
+    return
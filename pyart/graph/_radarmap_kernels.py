@@ -0,0 +1,301 @@
+"""
+pyart.graph._radarmap_kernels
+=============================
+
+Fused computational kernels used by the radar map displays.
+
+These kernels combine operations which would otherwise require several
+full passes over the ray by gate arrays of a sweep into a single
+traversal.  When Numba is available the kernels are just-in-time compiled
+with parallel loops over the rays and cached to disk to avoid repeated
+compilation, otherwise vectorized NumPy implementations are used.
+
+.. autosummary::
+    :toctree: generated/
+
+    make_aeqd_inverse
+    map_gate_coords
+    map_volume_coords
+    outside_mask
+
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+try:
+    from . import _aeqd_fast
+    _AEQD_FAST_AVAILABLE = True
+except ImportError:
+    _AEQD_FAST_AVAILABLE = False
+
+
+def _map_gate_coords_numpy(x, y, x0, y0):
+    """ NumPy implementation of map_gate_coords. """
+    xd = np.add(x, x0, dtype=np.float32)
+    yd = np.add(y, y0, dtype=np.float32)
+    return xd, yd
+
+
+def _outside_mask_numpy(data, base_mask, vmin, vmax, out=None, tmp=None):
+    """ NumPy implementation of outside_mask. """
+    mask = np.less(data, vmin, out=out)
+    if tmp is None:
+        mask |= data > vmax
+    else:
+        np.greater(data, vmax, out=tmp)
+        mask |= tmp
+    mask |= base_mask
+    return mask
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _map_gate_coords_numba(x, y, x0, y0):
+        """ Numba implementation of map_gate_coords. """
+        nrays, ngates = x.shape
+        xd = np.empty((nrays, ngates), dtype=np.float32)
+        yd = np.empty((nrays, ngates), dtype=np.float32)
+        for i in prange(nrays):
+            for j in range(ngates):
+                xd[i, j] = x[i, j] + x0
+                yd[i, j] = y[i, j] + y0
+        return xd, yd
+
+    @njit(parallel=True, cache=True)
+    def _map_volume_coords_numba(x, y, x0, y0):
+        """ Numba implementation of map_volume_coords. """
+        nsweeps, nrays, ngates = x.shape
+        xd = np.empty((nsweeps, nrays, ngates), dtype=np.float32)
+        yd = np.empty((nsweeps, nrays, ngates), dtype=np.float32)
+        for s in prange(nsweeps):
+            for i in range(nrays):
+                for j in range(ngates):
+                    xd[s, i, j] = x[s, i, j] + x0
+                    yd[s, i, j] = y[s, i, j] + y0
+        return xd, yd
+
+    @njit(parallel=True, cache=True)
+    def _outside_mask_numba(data, base_mask, vmin, vmax, mask):
+        """ Numba implementation of outside_mask. """
+        nrays, ngates = data.shape
+        for i in prange(nrays):
+            for j in range(ngates):
+                mask[i, j] = (base_mask[i, j] or data[i, j] < vmin or
+                              data[i, j] > vmax)
+        return mask
+
+
+def map_gate_coords(x, y, x0, y0):
+    """
+    Convert radar gate x, y locations in meters to map coordinates.
+
+    The shift by the radar location in map coordinates is applied in a
+    single traversal of each coordinate grid.  The returned arrays are
+    float32, which halves the memory traffic of this bandwidth limited
+    conversion while remaining sub-meter accurate over a radar scale map
+    domain, far below what is resolvable on a plot.
+
+    Parameters
+    ----------
+    x, y : array
+        Cartesian gate locations in meters from the radar.
+    x0, y0 : float
+        Radar location in map coordinates in meters.
+
+    Returns
+    -------
+    xd, yd : array of float32
+        Gate locations in map coordinates in meters.
+
+    """
+    if _NUMBA_AVAILABLE and x.ndim == 2:
+        return _map_gate_coords_numba(
+            np.ascontiguousarray(x), np.ascontiguousarray(y), x0, y0)
+    return _map_gate_coords_numpy(x, y, x0, y0)
+
+
+def map_volume_coords(x, y, x0, y0):
+    """
+    Convert stacked gate locations for several sweeps to map coordinates.
+
+    Identical to map_gate_coords but operating on (nsweeps, nrays,
+    ngates) stacks with the parallel loop over the sweeps, so the
+    coordinate conversion for a whole volume runs concurrently across
+    cores before any rendering starts.
+
+    Parameters
+    ----------
+    x, y : array, 3D
+        Cartesian gate locations in meters from the radar, stacked along
+        the first axis by sweep.
+    x0, y0 : float
+        Radar location in map coordinates in meters.
+
+    Returns
+    -------
+    xd, yd : array of float32, 3D
+        Gate locations in map coordinates in meters.
+
+    """
+    if _NUMBA_AVAILABLE and x.ndim == 3:
+        return _map_volume_coords_numba(
+            np.ascontiguousarray(x), np.ascontiguousarray(y), x0, y0)
+    return _map_gate_coords_numpy(x, y, x0, y0)
+
+
+def outside_mask(data, base_mask, vmin, vmax, out=None, tmp=None):
+    """
+    Return a boolean mask, True where gates should not be plotted.
+
+    Combines an existing mask with a mask of the data outside of the
+    vmin to vmax interval in a single pass, avoiding the intermediate
+    masked arrays created by np.ma.masked_outside.
+
+    Parameters
+    ----------
+    data : array
+        Raw (unmasked) field data.
+    base_mask : array of bool
+        Mask of gates which are already invalid.
+    vmin, vmax : float
+        Minimum and maximum valid values, data outside this interval is
+        masked.
+    out, tmp : array of bool or None
+        Scratch buffers with the same shape as data written into instead
+        of allocating new arrays, useful when masking repeatedly in an
+        animation loop.  None (the default) allocates fresh arrays.  As
+        the returned mask is the out array, out should only be reused
+        once the previous mask is no longer needed, for example when it
+        is attached to a masked array kept alive by a plot.
+
+    Returns
+    -------
+    mask : array of bool
+        True for gates which should be masked.  This is the out array
+        when one was provided.
+
+    """
+    if _NUMBA_AVAILABLE and data.ndim == 2:
+        if out is None:
+            out = np.empty(data.shape, dtype=np.bool_)
+        return _outside_mask_numba(
+            np.ascontiguousarray(data), np.ascontiguousarray(base_mask),
+            vmin, vmax, out)
+    return _outside_mask_numpy(data, base_mask, vmin, vmax, out, tmp)
+
+
+def make_aeqd_inverse(lat_0, lon_0, R=6370997.):
+    """
+    Return a function specialized for a fixed projection center which
+    maps azimuthal equidistant Cartesian x, y coordinates to geographic
+    coordinates.
+
+    The returned function computes the same transform as
+    :py:func:`pyart.core.transforms.cartesian_to_geographic_aeqd` but with
+    the projection center (typically the radar location) baked in when the
+    function is created.  When Numba is available the function is
+    just-in-time compiled with the center treated as a compile time
+    constant and a parallel loop over the points, removing all per call
+    projection setup from repeated conversions.  Without Numba the ahead
+    of time compiled Cython extension is preferred when it was built,
+    with a specialized NumPy closure as the final fallback.
+
+    Parameters
+    ----------
+    lat_0, lon_0 : float
+        Latitude and longitude, in degrees, of the center of the
+        projection.
+    R : float, optional
+        Earth radius in the same units as the coordinates to be
+        transformed, typically meters.
+
+    Returns
+    -------
+    inverse : callable
+        Function of (x, y) returning (lon, lat) in degrees.
+
+    """
+    # when Numba is not installed prefer the ahead-of-time compiled
+    # Cython extension, which avoids jit compilation time entirely, and
+    # fall back to a specialized NumPy closure when the extension was not
+    # built.
+    lat_0_rad = np.deg2rad(lat_0)
+    lon_0_rad = np.deg2rad(lon_0)
+    sin_lat_0 = np.sin(lat_0_rad)
+    cos_lat_0 = np.cos(lat_0_rad)
+
+    def _inverse_numpy(x, y):
+        x = np.atleast_1d(np.asarray(x))
+        y = np.atleast_1d(np.asarray(y))
+        rho = np.sqrt(x * x + y * y)
+        c = rho / R
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lat_rad = np.arcsin(
+                np.cos(c) * sin_lat_0 + y * np.sin(c) * cos_lat_0 / rho)
+        lat_deg = np.rad2deg(lat_rad)
+        # fix cases where the distance from the center is zero
+        lat_deg[rho == 0] = lat_0
+        x1 = x * np.sin(c)
+        x2 = rho * cos_lat_0 * np.cos(c) - y * sin_lat_0 * np.sin(c)
+        lon_deg = np.rad2deg(lon_0_rad + np.arctan2(x1, x2))
+        # longitudes should be from -180 to 180 degrees
+        lon_deg[lon_deg > 180] -= 360.
+        lon_deg[lon_deg < -180] += 360.
+        return lon_deg, lat_deg
+
+    if not _NUMBA_AVAILABLE:
+        if not _AEQD_FAST_AVAILABLE:
+            return _inverse_numpy
+
+        def _inverse_cython(x, y):
+            x = np.ascontiguousarray(np.atleast_1d(x), dtype=np.float64)
+            y = np.ascontiguousarray(np.atleast_1d(y), dtype=np.float64)
+            lon = np.empty(x.size, dtype=np.float64)
+            lat = np.empty(x.size, dtype=np.float64)
+            _aeqd_fast.aeqd_inverse(
+                x.ravel(), y.ravel(), lat_0, lon_0, R, lon, lat)
+            return lon.reshape(x.shape), lat.reshape(x.shape)
+
+        return _inverse_cython
+
+    @njit(parallel=True)
+    def _inverse_numba(x, y):
+        npts = x.size
+        xf = x.ravel()
+        yf = y.ravel()
+        lon = np.empty(npts, dtype=np.float64)
+        lat = np.empty(npts, dtype=np.float64)
+        for i in prange(npts):
+            rho = np.sqrt(xf[i] * xf[i] + yf[i] * yf[i])
+            if rho == 0.:
+                lon[i] = lon_0
+                lat[i] = lat_0
+                continue
+            c = rho / R
+            sin_c = np.sin(c)
+            cos_c = np.cos(c)
+            lat[i] = np.rad2deg(np.arcsin(
+                cos_c * sin_lat_0 + yf[i] * sin_c * cos_lat_0 / rho))
+            lon_deg = np.rad2deg(lon_0_rad + np.arctan2(
+                xf[i] * sin_c,
+                rho * cos_lat_0 * cos_c - yf[i] * sin_lat_0 * sin_c))
+            if lon_deg > 180.:
+                lon_deg -= 360.
+            elif lon_deg < -180.:
+                lon_deg += 360.
+            lon[i] = lon_deg
+        return lon.reshape(x.shape), lat.reshape(x.shape)
+
+    def _inverse(x, y):
+        x = np.ascontiguousarray(np.atleast_1d(x), dtype=np.float64)
+        y = np.ascontiguousarray(np.atleast_1d(y), dtype=np.float64)
+        return _inverse_numba(x, y)
+
+    return _inverse
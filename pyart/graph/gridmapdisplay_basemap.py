@@ -18,12 +18,19 @@ import warnings
 
 import numpy as np
 import matplotlib.pyplot as plt
+
+# Importing Basemap is expensive as the boundary geometry libraries are
+# loaded at import time.  Only the availability of the package is
+# determined here, the import itself is deferred until a map is plotted.
 try:
-    from mpl_toolkits.basemap import Basemap
-    from mpl_toolkits.basemap import pyproj
-    _BASEMAP_AVAILABLE = True
-except ImportError:
-    _BASEMAP_AVAILABLE = False
+    from importlib.util import find_spec
+    _BASEMAP_AVAILABLE = find_spec('mpl_toolkits.basemap') is not None
+except ImportError:     # Python 2, must import to check availability
+    try:
+        from mpl_toolkits.basemap import Basemap
+        _BASEMAP_AVAILABLE = True
+    except ImportError:
+        _BASEMAP_AVAILABLE = False
 
 from . import common
 from ..exceptions import MissingOptionalDependency
@@ -663,6 +670,7 @@ class GridMapDisplayBasemap(object):
                 kwargs[key] = default_args[key]
 
         # plot the basemap
+        from mpl_toolkits.basemap import Basemap
         self.basemap = Basemap(**kwargs)
 
         return self.basemap
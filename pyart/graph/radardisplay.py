@@ -1299,16 +1299,24 @@ class RadarDisplay(object):
         sweep_slice = self._radar.get_slice(sweep)
         data = self.fields[field]['data'][sweep_slice]
 
-        # mask data if mask_tuple provided
+        # combine the mask_tuple and gatefilter masks into a single boolean
+        # mask using branchless bitwise operations and attach it in one
+        # step, avoiding the allocation of an intermediate masked array per
+        # masking source.
+        combined_mask = None
         if mask_tuple is not None:
             mask_field, mask_value = mask_tuple
             mdata = self.fields[mask_field]['data'][sweep_slice]
-            data = np.ma.masked_where(mdata < mask_value, data)
-
-        # mask data if gatefilter provided
+            combined_mask = np.ma.getdata(mdata) < mask_value
+            combined_mask |= np.ma.getmaskarray(mdata)
         if gatefilter is not None:
             mask_filter = gatefilter.gate_excluded[sweep_slice]
-            data = np.ma.masked_array(data, mask_filter)
+            if combined_mask is None:
+                combined_mask = mask_filter
+            else:
+                combined_mask |= mask_filter
+        if combined_mask is not None:
+            data = np.ma.array(data, mask=combined_mask, copy=False)
 
         # filter out antenna transitions
         if filter_transitions and self.antenna_transition is not None:
@@ -12,19 +12,198 @@ Class for creating plots on a geographic map using a Radar object and Basemap.
 
 """
 
+import os
+import pickle
 import warnings
+from collections import OrderedDict
 
 import numpy as np
-try:
-    from mpl_toolkits.basemap import Basemap
-    _BASEMAP_AVAILABLE = True
-except ImportError:
-    _BASEMAP_AVAILABLE = False
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
+# Importing Basemap is expensive as the boundary geometry libraries are
+# loaded at import time.  Only the availability of the package is
+# determined here, the import itself is deferred until a map is plotted.
+try:
+    from importlib.util import find_spec
+    _BASEMAP_AVAILABLE = find_spec('mpl_toolkits.basemap') is not None
+except ImportError:     # Python 2, must import to check availability
+    try:
+        from mpl_toolkits.basemap import Basemap
+        _BASEMAP_AVAILABLE = True
+    except ImportError:
+        _BASEMAP_AVAILABLE = False
+
+from . import _radarmap_kernels
 from .radardisplay import RadarDisplay
 from .common import parse_ax_fig, parse_vmin_vmax, parse_cmap
 from ..exceptions import MissingOptionalDependency
 
+# Cache of pickled Basemap instances keyed on the map region and settings.
+# Creating a Basemap can take tens of seconds when a high resolution
+# boundary database is used as the full database is read even for a small
+# region.  Unpickling a previously created instance takes milliseconds,
+# which greatly speeds up workflows which plot the same region repeatedly,
+# for example plotting multiple sweeps, fields or volumes from a single
+# radar.
+_BASEMAP_CACHE = OrderedDict()
+_BASEMAP_CACHE_MAXSIZE = 8
+
+# Basemap class, imported on first use.
+_BASEMAP_CLASS = None
+
+# Unit circle lookup table used when drawing range rings.  The default
+# 360 point circle is computed at import time, other resolutions are
+# cached on first use.  Single precision is ample for plotted positions
+# and halves the table size.
+_RING_NPTS = 360
+_RING_ANGLE = np.linspace(0., 2.0 * np.pi, _RING_NPTS)
+_UNIT_CIRCLE_CACHE = {
+    _RING_NPTS: (np.sin(_RING_ANGLE).astype(np.float32),
+                 np.cos(_RING_ANGLE).astype(np.float32))}
+
+
+def _unit_circle(npts):
+    """ Return cached sin and cos of npts angles around the unit circle. """
+    if npts not in _UNIT_CIRCLE_CACHE:
+        angle = np.linspace(0., 2.0 * np.pi, npts)
+        _UNIT_CIRCLE_CACHE[npts] = (np.sin(angle).astype(np.float32),
+                                    np.cos(angle).astype(np.float32))
+    return _UNIT_CIRCLE_CACHE[npts]
+
+
+def _get_basemap_class():
+    """ Import, cache and return the Basemap class. """
+    global _BASEMAP_CLASS
+    if _BASEMAP_CLASS is None:
+        from mpl_toolkits.basemap import Basemap
+        _BASEMAP_CLASS = Basemap
+    return _BASEMAP_CLASS
+
+
+def _make_basemap(ax, **kwargs):
+    """
+    Create a Basemap, reusing a cached instance when possible.
+
+    Basemap instances are created without an axis bound, pickled into a
+    module level least-recently-used cache, and unpickled on reuse.  The
+    requested axis is bound to the instance before it is returned.
+    Floating point keyword arguments, typically the corner or center
+    coordinates of the map region, are rounded to two decimal places when
+    building the cache key so that minor jitter in an automatically
+    determined region does not defeat the cache.
+
+    """
+    Basemap = _get_basemap_class()
+    try:
+        key = tuple(sorted(
+            (k, round(v, 2) if isinstance(v, float) else v)
+            for k, v in kwargs.items()))
+        hash(key)
+    except TypeError:
+        # unhashable keyword argument, create the instance directly
+        basemap = Basemap(ax=ax, **kwargs)
+        return basemap
+    if key in _BASEMAP_CACHE:
+        # mark the entry as recently used and unpickle it
+        pickled_basemap = _BASEMAP_CACHE.pop(key)
+        _BASEMAP_CACHE[key] = pickled_basemap
+        basemap = pickle.loads(pickled_basemap)
+    else:
+        basemap = Basemap(**kwargs)
+        try:
+            _BASEMAP_CACHE[key] = pickle.dumps(basemap, protocol=-1)
+        except (pickle.PicklingError, TypeError):
+            pass    # do not cache instances which cannot be pickled
+        while len(_BASEMAP_CACHE) > _BASEMAP_CACHE_MAXSIZE:
+            _BASEMAP_CACHE.popitem(last=False)
+    basemap.ax = ax
+    return basemap
+
+
+# Cache of projected shapefile segments keyed on the resolved file path,
+# its modification time and the map region and projection, so repeated
+# plots do not re-read and re-project an unchanged shapefile.
+_SHAPEFILE_CACHE = {}
+
+
+def _draw_shapefile(basemap, shapefile, ax):
+    """
+    Draw an ESRI shapefile as background, caching the parsed segments.
+
+    The first draw of a shapefile on a map region reads and projects the
+    file through basemap.readshapefile, the projected segments are then
+    cached and redrawn directly as a LineCollection on later calls,
+    removing the file parsing and geometry projection from repeated
+    plots.  The cache is invalidated when the file is modified or the map
+    region or projection changes.
+
+    """
+    path = os.path.abspath(shapefile)
+    try:
+        mtime = os.path.getmtime(path + '.shp')
+    except OSError:
+        # missing or unreadable file, let readshapefile report the error
+        basemap.readshapefile(path, 'shapefile', ax=ax)
+        return
+    region = (round(basemap.llcrnrlon, 2), round(basemap.llcrnrlat, 2),
+              round(basemap.urcrnrlon, 2), round(basemap.urcrnrlat, 2),
+              tuple(sorted(basemap.projparams.items())))
+    key = (path, mtime, region)
+    if key in _SHAPEFILE_CACHE:
+        # match the default readshapefile boundary style
+        ax.add_collection(LineCollection(
+            _SHAPEFILE_CACHE[key], colors='k', linewidths=0.5))
+    else:
+        basemap.readshapefile(path, 'shapefile', ax=ax)
+        _SHAPEFILE_CACHE[key] = basemap.shapefile
+
+
+def _grid_is_rectilinear(xd, yd):
+    """
+    Check if corner coordinate grids form a regular rectilinear grid.
+
+    True when x varies only along the gate axis, y varies only along the
+    ray axis and both are strictly increasing, the layout required for
+    the fast image style path of pcolorfast.  Radar sweeps on strongly
+    curved projections fail this test and must use pcolormesh.
+
+    """
+    if xd.ndim != 2:
+        return False
+    x_row = xd[0]
+    y_col = yd[:, 0]
+    dx = np.diff(x_row)
+    dy = np.diff(y_col)
+    if not (np.all(dx > 0) and np.all(dy > 0)):
+        return False
+    x_tol = 1e-3 * dx.min()
+    y_tol = 1e-3 * dy.min()
+    return (np.abs(xd - x_row[np.newaxis, :]).max() <= x_tol and
+            np.abs(yd - y_col[:, np.newaxis]).max() <= y_tol)
+
+
+def _block_reduce(data, xd, yd, block_rays, block_gates):
+    """
+    Block average sweep data and subsample the matching corner coordinates.
+
+    The data is averaged over blocks of block_rays by block_gates gates and
+    every block_rays-th/block_gates-th corner coordinate is kept.  Trailing
+    rays and gates which do not fill a complete block are dropped.  The
+    coordinate arrays must hold the gate corners, one more row and column
+    than the data.
+
+    """
+    nrays = (data.shape[0] // block_rays) * block_rays
+    ngates = (data.shape[1] // block_gates) * block_gates
+    data = data[:nrays, :ngates]
+    data = data.reshape(nrays // block_rays, block_rays,
+                        ngates // block_gates, block_gates)
+    data = data.mean(axis=3).mean(axis=1)
+    xd = xd[0:nrays + 1:block_rays, 0:ngates + 1:block_gates]
+    yd = yd[0:nrays + 1:block_rays, 0:ngates + 1:block_gates]
+    return data, xd, yd
+
 
 class RadarMapDisplayBasemap(RadarDisplay):
     """
@@ -96,6 +275,20 @@ class RadarMapDisplayBasemap(RadarDisplay):
         self.basemap = None
         self._x0 = None     # x axis radar location in map coords (meters)
         self._y0 = None     # y axis radar location in map coords (meters)
+        # coastline and state boundary segments in map coordinates cached
+        # from the first plot of a map region, None when not yet cached.
+        self._boundary_region = None
+        self._coast_segs = None
+        self._state_segs = None
+        # caches of gate locations, the gate geometry depends only on the
+        # sweep and plot settings, not on the field being plotted, so it
+        # can be reused when several fields of a sweep are plotted.
+        self._xy_cache = {}
+        self._mapxy_cache = {}
+        # scratch boolean buffer keyed on sweep shape, reused for the
+        # intermediate comparison of the mask_outside path.  The final
+        # mask is stored on the plotted artist so it cannot be reused.
+        self._mask_bufs = {}
         return
 
     def _check_basemap(self):
@@ -103,6 +296,94 @@ class RadarMapDisplayBasemap(RadarDisplay):
         if self.basemap is None:
             raise ValueError('no basemap plotted')
 
+    def _radar_xy_to_map_xy(self, x, y):
+        """
+        Convert radar Cartesian x, y coordinates in meters to map
+        projection coordinates.
+
+        The conversion is a single vectorized offset by the radar location
+        in map coordinates, no intermediate geographic round trip is
+        performed.
+
+        """
+        return np.add(x, self._x0), np.add(y, self._y0)
+
+    def _get_x_y_m(self, sweep, edges, filter_transitions):
+        """ Retrieve and return gate x, y locations in meters. """
+        # the radar provides gate locations in meters, fetching them
+        # directly avoids the km conversion of _get_x_y and the matching
+        # scaling back to meters when plotting.
+        x, y, _ = self._radar.get_gate_x_y_z(
+            sweep, edges=edges, filter_transitions=filter_transitions)
+        # gate locations are freshly computed, apply the shift in place
+        x += self.shift[0]
+        y += self.shift[1]
+        return x, y
+
+    def _get_x_y_m_cached(self, sweep, edges, filter_transitions):
+        """ Retrieve and return gate x, y locations in meters, cached. """
+        key = (sweep, edges, filter_transitions)
+        if key not in self._xy_cache:
+            self._xy_cache[key] = self._get_x_y_m(
+                sweep, edges, filter_transitions)
+        return self._xy_cache[key]
+
+    def _get_map_coords_cached(self, x, y, sweep, edges, filter_transitions):
+        """ Retrieve and return gate locations in map coords, cached. """
+        key = (sweep, edges, filter_transitions, self._x0, self._y0)
+        if key not in self._mapxy_cache:
+            self._mapxy_cache[key] = _radarmap_kernels.map_gate_coords(
+                x, y, self._x0, self._y0)
+        return self._mapxy_cache[key]
+
+    def precompute_sweep_coords(self, sweeps=None, edges=True,
+                                filter_transitions=True):
+        """
+        Precompute map coordinates for several sweeps before rendering.
+
+        Gate locations of the requested sweeps are converted to map
+        coordinates in a single pass, run concurrently across sweeps when
+        Numba is available, and stored in the cache used by plot_ppi_map.
+        A loop rendering a gallery of sweeps afterwards performs only the
+        Matplotlib work per sweep.  A basemap must have been plotted so
+        that the radar location in map coordinates is known.
+
+        Parameters
+        ----------
+        sweeps : list of int or None
+            Sweeps to precompute coordinates for.  None will precompute
+            all sweeps in the volume.
+        edges : bool
+            Must match the edges parameter of the later plot_ppi_map
+            calls, see its documentation.
+        filter_transitions : bool
+            Must match the filter_transitions parameter of the later
+            plot_ppi_map calls, see its documentation.
+
+        """
+        self._check_basemap()
+        if sweeps is None:
+            sweeps = range(self._radar.nsweeps)
+        sweeps = list(sweeps)
+        xys = [self._get_x_y_m_cached(sweep, edges, filter_transitions)
+               for sweep in sweeps]
+        shapes = set([x.shape for x, y in xys])
+        if len(shapes) == 1 and len(sweeps) > 1:
+            # uniform volume, convert all sweeps in one parallel pass
+            x_stack = np.array([x for x, y in xys])
+            y_stack = np.array([y for x, y in xys])
+            xd, yd = _radarmap_kernels.map_volume_coords(
+                x_stack, y_stack, self._x0, self._y0)
+            for index, sweep in enumerate(sweeps):
+                key = (sweep, edges, filter_transitions,
+                       self._x0, self._y0)
+                self._mapxy_cache[key] = (xd[index], yd[index])
+        else:
+            # sweeps with differing shapes, convert them one at a time
+            for sweep, (x, y) in zip(sweeps, xys):
+                self._get_map_coords_cached(
+                    x, y, sweep, edges, filter_transitions)
+
     def plot_ppi_map(
             self, field, sweep=0, mask_tuple=None,
             vmin=None, vmax=None, cmap=None, norm=None, mask_outside=False,
@@ -114,7 +395,8 @@ class RadarMapDisplayBasemap(RadarDisplay):
             width=None, height=None, lon_0=None, lat_0=None,
             resolution='h', shapefile=None, edges=True, gatefilter=None,
             basemap=None, filter_transitions=True, embelish=True,
-            ticks=None, ticklabs=None, raster=False, alpha=None, **kwargs):
+            ticks=None, ticklabs=None, raster=False, downsample=False,
+            alpha=None, **kwargs):
         """
         Plot a PPI volume sweep onto a geographic map.
 
@@ -228,6 +510,13 @@ class RadarMapDisplayBasemap(RadarDisplay):
             high resolution data over large areas.  Be sure to set the dpi
             of the plot for your application if you save it as a vector format
             (i.e., pdf, eps, svg).
+        downsample : bool
+            True to block average the sweep down to approximately twice
+            the pixel resolution of the axes before plotting.  Speeds up
+            rendering of sweeps with many more gates than screen pixels at
+            the cost of detail which could not be resolved on screen
+            anyway.  False, the default, plots the data at full
+            resolution.
         alpha : float or None
             Set the alpha tranparency of the radar plot. Useful for
             overplotting radar over other datasets.
@@ -249,32 +538,52 @@ class RadarMapDisplayBasemap(RadarDisplay):
         # get data for the plot
         data = self._get_data(
             field, sweep, mask_tuple, filter_transitions, gatefilter)
-        x, y = self._get_x_y(sweep, edges, filter_transitions)
+        x, y = self._get_x_y_m_cached(sweep, edges, filter_transitions)
 
         # mask the data where outside the limits
+        # the existing mask and the outside of limits mask are combined in
+        # a single fused pass over the sweep.  Only the intermediate
+        # comparison buffer is reused between calls, the resulting mask is
+        # kept alive by the plotted artist and must be a fresh array so a
+        # later plot does not rewrite the mask of an earlier panel.
         if mask_outside:
-            data = np.ma.masked_outside(data, vmin, vmax)
+            if data.shape not in self._mask_bufs:
+                self._mask_bufs[data.shape] = np.empty(
+                    data.shape, dtype=bool)
+            tmp = self._mask_bufs[data.shape]
+            mask = _radarmap_kernels.outside_mask(
+                np.ma.getdata(data), np.ma.getmaskarray(data), vmin, vmax,
+                tmp=tmp)
+            data = np.ma.array(data, mask=mask, copy=False)
 
         # create the basemap if not provided
-        if type(basemap) != Basemap:
+        if type(basemap) != _get_basemap_class():
             using_corners = (None not in [min_lon, min_lat, max_lon, max_lat])
             if using_corners:
-                basemap = Basemap(
-                    llcrnrlon=min_lon, llcrnrlat=min_lat,
+                basemap = _make_basemap(
+                    ax, llcrnrlon=min_lon, llcrnrlat=min_lat,
                     urcrnrlon=max_lon, urcrnrlat=max_lat,
                     lat_0=lat_0, lon_0=lon_0, projection=projection,
-                    area_thresh=area_thresh, resolution=resolution, ax=ax,
+                    area_thresh=area_thresh, resolution=resolution,
                     **kwargs)
             else:   # using width and height
                 # map domain determined from location of radar gates
+                # The extrema of a PPI sweep lie on the boundary of the
+                # coordinate grid, scanning only the perimeter gates avoids
+                # a full pass over the ray by gate arrays.
+                if x.ndim == 2:
+                    x_edge = np.concatenate((x[0], x[-1], x[:, 0], x[:, -1]))
+                    y_edge = np.concatenate((y[0], y[-1], y[:, 0], y[:, -1]))
+                else:
+                    x_edge, y_edge = x, y
                 if width is None:
-                    width = (x.max() - x.min()) * 1000.
+                    width = x_edge.max() - x_edge.min()
                 if height is None:
-                    height = (y.max() - y.min()) * 1000.
-                basemap = Basemap(
-                    width=width, height=height, lon_0=lon_0, lat_0=lat_0,
+                    height = y_edge.max() - y_edge.min()
+                basemap = _make_basemap(
+                    ax, width=width, height=height, lon_0=lon_0, lat_0=lat_0,
                     projection=projection, area_thresh=area_thresh,
-                    resolution=resolution, ax=ax, **kwargs)
+                    resolution=resolution, **kwargs)
 
         # The cylindrical equidistant projection does not support conversions
         # from geographic (lon/lat) to map projection (x/y) coordinates and
@@ -283,44 +592,117 @@ class RadarMapDisplayBasemap(RadarDisplay):
             raise ValueError(
                 'The cylindrical equidistant projection is not supported')
 
-        # add embelishments
-        if embelish is True:
-            basemap.drawcoastlines(linewidth=1.25)
-            basemap.drawstates()
-            basemap.drawparallels(
-                lat_lines, labels=[True, False, False, False])
-            basemap.drawmeridians(
-                lon_lines, labels=[False, False, False, True])
-        self.basemap = basemap
-        self._x0, self._y0 = basemap(self.loc[1], self.loc[0])
-
-        # plot the data and optionally the shape file
-        # we need to convert the radar gate locations (x and y) which are in
-        # km to meters as well as add the map coordiate radar location
-        # which is given by self._x0, self._y0.
-        if norm is not None:  # if norm is set do not override with vmin/vmax
-            vmin = vmax = None
-        pm = basemap.pcolormesh(
-            self._x0 + x * 1000., self._y0 + y * 1000., data,
-            vmin=vmin, vmax=vmax, cmap=cmap, norm=norm, alpha=alpha)
-
-        if raster:
-            pm.set_rasterized(True)
-
-        if shapefile is not None:
-            basemap.readshapefile(shapefile, 'shapefile', ax=ax)
-
-        if title_flag:
-            self._set_title(field, sweep, title, ax)
-
-        # add plot and field to lists
-        self.plots.append(pm)
-        self.plot_vars.append(field)
-
-        if colorbar_flag:
-            self.plot_colorbar(
-                mappable=pm, label=colorbar_label, field=field, fig=fig,
-                ax=ax, ticks=ticks, ticklabs=ticklabs)
+        # Each Basemap drawing method, the title and the colorbar can
+        # trigger a full figure draw in interactive sessions.  Suspend
+        # interactive drawing while the plot is assembled and issue a
+        # single deferred draw at the end.
+        was_interactive = plt.isinteractive()
+        if was_interactive:
+            plt.ioff()
+        try:
+            # add embelishments
+            if embelish is True:
+                # Boundary drawing re-clips the full boundary database against
+                # the map region on every call even though a radar covers a
+                # small lat/lon window.  Cache the projected coastline and
+                # state segments from the first plot of a region and redraw
+                # them directly on later plots of the same region.
+                region = (
+                    round(basemap.llcrnrlon, 2), round(basemap.llcrnrlat, 2),
+                    round(basemap.urcrnrlon, 2), round(basemap.urcrnrlat, 2),
+                    basemap.resolution, basemap.area_thresh,
+                    tuple(sorted(basemap.projparams.items())))
+                if region == self._boundary_region:
+                    ax.add_collection(
+                        LineCollection(self._coast_segs, colors='k',
+                                       linewidths=1.25))
+                    ax.add_collection(
+                        LineCollection(self._state_segs, colors='k',
+                                       linewidths=0.5))
+                else:
+                    coastlines = basemap.drawcoastlines(linewidth=1.25)
+                    states = basemap.drawstates()
+                    self._coast_segs = coastlines.get_segments()
+                    self._state_segs = states.get_segments()
+                    self._boundary_region = region
+                basemap.drawparallels(
+                    lat_lines, labels=[True, False, False, False])
+                basemap.drawmeridians(
+                    lon_lines, labels=[False, False, False, True])
+            self.basemap = basemap
+            self._x0, self._y0 = basemap(self.loc[1], self.loc[0])
+
+            # plot the data and optionally the shape file
+            # the radar gate locations (x and y, in meters) are shifted by the
+            # map coordinate radar location which is given by self._x0,
+            # self._y0, in a single traversal per axis, compiled and run in
+            # parallel over the rays when Numba is available.
+            # if norm is set do not override with vmin/vmax
+            if norm is not None:
+                vmin = vmax = None
+            xd, yd = self._get_map_coords_cached(
+                x, y, sweep, edges, filter_transitions)
+
+            # optionally block average the sweep down to roughly twice the
+            # pixel resolution of the axes, quads smaller than half a pixel
+            # cannot be resolved on screen.
+            if downsample and xd.shape[0] == data.shape[0] + 1:
+                block_rays = max(
+                    1, data.shape[0] // max(1, int(2 * ax.bbox.height)))
+                block_gates = max(
+                    1, data.shape[1] // max(1, int(2 * ax.bbox.width)))
+                if block_rays > 1 or block_gates > 1:
+                    data, xd, yd = _block_reduce(
+                        data, xd, yd, block_rays, block_gates)
+            # With edges=True the coordinate arrays hold the gate corners, one
+            # more row and column than the data.  Rasterizing at creation
+            # (when requested) avoids a second pass over the artist.  When
+            # the projected corners happen to form a regular rectilinear grid
+            # the O(N) image style pcolorfast path is used instead of the per
+            # quad pcolormesh path.
+            if (xd.shape[0] == data.shape[0] + 1 and
+                    _grid_is_rectilinear(xd, yd)):
+                pm = ax.pcolorfast(
+                    xd[0], yd[:, 0], data, vmin=vmin, vmax=vmax, cmap=cmap,
+                    norm=norm)
+                if alpha is not None:
+                    pm.set_alpha(alpha)
+                if raster:
+                    pm.set_rasterized(True)
+                basemap.set_axes_limits(ax=ax)
+            elif xd.shape[0] == data.shape[0] + 1:
+                # corner style coordinates, requesting flat shading
+                # explicitly lets Matplotlib use the corners directly instead
+                # of deducing a shading mode and interpolating per quad.
+                pm = basemap.pcolormesh(
+                    xd, yd, data, vmin=vmin, vmax=vmax, cmap=cmap, norm=norm,
+                    alpha=alpha, shading='flat', rasterized=raster)
+            else:
+                # with edges=False the coordinates match the data shape,
+                # which flat shading rejects, let Matplotlib deduce the
+                # shading mode.
+                pm = basemap.pcolormesh(
+                    xd, yd, data, vmin=vmin, vmax=vmax, cmap=cmap, norm=norm,
+                    alpha=alpha, rasterized=raster)
+
+            if shapefile is not None:
+                _draw_shapefile(basemap, shapefile, ax)
+
+            if title_flag:
+                self._set_title(field, sweep, title, ax)
+
+            # add plot and field to lists
+            self.plots.append(pm)
+            self.plot_vars.append(field)
+
+            if colorbar_flag:
+                self.plot_colorbar(
+                    mappable=pm, label=colorbar_label, field=field, fig=fig,
+                    ax=ax, ticks=ticks, ticklabs=ticklabs)
+        finally:
+            if was_interactive:
+                plt.ion()
+                ax.figure.canvas.draw_idle()
         return
 
     def plot_point(self, lon, lat, symbol='ro', label_text=None,
@@ -345,6 +727,41 @@ class RadarMapDisplayBasemap(RadarDisplay):
             Offset in lon, lat degrees for the bottom left corner of the label
             text relative to the point. A value of None will use 0.01 de
 
+        """
+        if label_text is None:
+            label_texts = None
+        else:
+            label_texts = [label_text]
+        self.plot_points([lon], [lat], symbol=symbol,
+                         label_texts=label_texts, label_offset=label_offset,
+                         **kwargs)
+
+    def plot_points(self, lons, lats, symbol='ro', label_texts=None,
+                    label_offset=(None, None), **kwargs):
+        """
+        Plot points on the current map.
+
+        All points are converted and drawn with a single basemap call so
+        that many points share one conversion to map coordinates and one
+        artist.
+
+        Additional arguments are passed to basemap.plot.
+
+        Parameters
+        ----------
+        lons : array
+            Longitude of points to plot.
+        lats : array
+            Latitude of points to plot.
+        symbol : str
+            Matplotlib compatible string which specified the symbol of the
+            points.
+        label_texts : list of str or None, optional.
+            Text to label symbols with.  If None no labels will be added.
+        label_offset : [float, float]
+            Offset in lon, lat degrees for the bottom left corner of the
+            label text relative to the point. A value of None will use 0.01.
+
         """
         self._check_basemap()
         lon_offset, lat_offset = label_offset
@@ -352,13 +769,17 @@ class RadarMapDisplayBasemap(RadarDisplay):
             lon_offset = 0.01
         if lat_offset is None:
             lat_offset = 0.01
-        self.basemap.plot(lon, lat, symbol, latlon=True, **kwargs)
-        if label_text is not None:
+        lons = np.atleast_1d(lons)
+        lats = np.atleast_1d(lats)
+        self.basemap.plot(lons, lats, symbol, latlon=True, **kwargs)
+        if label_texts is not None:
             # basemap does not have a text method so we must determine
             # the x and y points and plot them on the basemap's axis.
             x_text, y_text = self.basemap(
-                lon + lon_offset, lat + lat_offset)
-            self.basemap.ax.text(x_text, y_text, label_text)
+                lons + lon_offset, lats + lat_offset)
+            for x, y, label_text in zip(x_text, y_text, label_texts):
+                if label_text is not None:
+                    self.basemap.ax.text(x, y, label_text)
 
     def plot_line_geo(self, line_lons, line_lats, line_style='r-', **kwargs):
         """
@@ -397,8 +818,8 @@ class RadarMapDisplayBasemap(RadarDisplay):
 
         """
         self._check_basemap()
-        self.basemap.plot(self._x0 + line_x, self._y0 + line_y, line_style,
-                          latlon=False, **kwargs)
+        map_x, map_y = self._radar_xy_to_map_xy(line_x, line_y)
+        self.basemap.plot(map_x, map_y, line_style, latlon=False, **kwargs)
 
     def plot_range_ring(self, range_ring_location_km, npts=360,
                         line_style='k-', **kwargs):
@@ -424,7 +845,7 @@ class RadarMapDisplayBasemap(RadarDisplay):
             color = kwargs.pop('col')
             kwargs['c'] = color
         self._check_basemap()
-        angle = np.linspace(0., 2.0 * np.pi, npts)
-        xpts = range_ring_location_km * 1000. * np.sin(angle)
-        ypts = range_ring_location_km * 1000. * np.cos(angle)
+        sin_angle, cos_angle = _unit_circle(npts)
+        xpts = range_ring_location_km * 1000. * sin_angle
+        ypts = range_ring_location_km * 1000. * cos_angle
         self.plot_line_xy(xpts, ypts, line_style=line_style, **kwargs)
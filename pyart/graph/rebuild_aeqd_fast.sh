@@ -0,0 +1,4 @@
+# remove and rebuild the _aeqd_fast.so module
+rm -fv _aeqd_fast.so
+cython _aeqd_fast.pyx
+python setup.py build_ext -i
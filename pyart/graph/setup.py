@@ -1,3 +1,4 @@
+import sys
 
 
 def configuration(parent_package='', top_path=None):
@@ -5,6 +6,11 @@ def configuration(parent_package='', top_path=None):
     config = Configuration('graph', parent_package, top_path)
     config.add_data_dir('tests')
     config.add_data_files('balance-rgb.txt')
+    # _aeqd_fast.c is generated by Cython 3 and only compiles on
+    # Python 3.9+.  The extension is optional at runtime, skip it on
+    # older interpreters instead of failing the build.
+    if sys.version_info >= (3, 9):
+        config.add_extension('_aeqd_fast', sources=['_aeqd_fast.c'])
     return config
 
 
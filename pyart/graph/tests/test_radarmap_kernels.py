@@ -0,0 +1,59 @@
+""" Unit Tests for Py-ART's graph/_radarmap_kernels.py module. """
+
+import numpy as np
+
+from pyart.core.transforms import cartesian_to_geographic_aeqd
+from pyart.graph import _radarmap_kernels
+
+
+def test_map_gate_coords():
+    x = np.linspace(-10000., 10000., 12).reshape(3, 4)
+    y = np.linspace(-5000., 5000., 12).reshape(3, 4)
+    xd, yd = _radarmap_kernels.map_gate_coords(x, y, 100., 200.)
+    assert np.allclose(xd, x + 100.)
+    assert np.allclose(yd, y + 200.)
+
+
+def test_map_gate_coords_float32_residual():
+    # single precision map coordinates must stay sub-meter accurate over
+    # a radar scale (~500 km) map domain.
+    x = np.linspace(-250000., 250000., 1000).reshape(10, 100)
+    y = np.linspace(-250000., 250000., 1000).reshape(10, 100)
+    xd, yd = _radarmap_kernels.map_gate_coords(x, y, 300000., 300000.)
+    assert xd.dtype == np.float32
+    assert yd.dtype == np.float32
+    assert np.abs(xd - (x + 300000.)).max() < 1.
+    assert np.abs(yd - (y + 300000.)).max() < 1.
+
+
+def test_make_aeqd_inverse():
+    lat_0, lon_0 = 36.5, -97.6
+    inverse = _radarmap_kernels.make_aeqd_inverse(lat_0, lon_0)
+    x = np.array([0., 1000., -50000., 250000.])
+    y = np.array([0., -2000., 100000., -250000.])
+    lon, lat = inverse(x, y)
+    ref_lon, ref_lat = cartesian_to_geographic_aeqd(x, y, lon_0, lat_0)
+    assert np.allclose(lon, ref_lon)
+    assert np.allclose(lat, ref_lat)
+
+
+def test_outside_mask():
+    data = np.array([[-10., 0., 10.], [20., 30., 40.]])
+    base_mask = np.zeros((2, 3), dtype=bool)
+    base_mask[1, 2] = True
+    mask = _radarmap_kernels.outside_mask(data, base_mask, 0., 30.)
+    reference = base_mask | np.ma.getmaskarray(
+        np.ma.masked_outside(data, 0., 30.))
+    assert np.array_equal(mask, reference)
+
+
+def test_outside_mask_scratch_buffers():
+    data = np.array([[-10., 0., 10.], [20., 30., 40.]])
+    base_mask = np.zeros((2, 3), dtype=bool)
+    out = np.empty((2, 3), dtype=bool)
+    tmp = np.empty((2, 3), dtype=bool)
+    mask = _radarmap_kernels.outside_mask(
+        data, base_mask, 0., 30., out=out, tmp=tmp)
+    assert mask is out
+    reference = np.ma.getmaskarray(np.ma.masked_outside(data, 0., 30.))
+    assert np.array_equal(mask, reference)
@@ -70,5 +70,43 @@ def test_radardisplay_cylindrical_proj_error_basemap():
         resolution='c')
 
 
+# Tests of the pure NumPy helper functions, these do not require Basemap
+def test_grid_is_rectilinear():
+    helper = pyart.graph.radarmapdisplay_basemap._grid_is_rectilinear
+    xd, yd = np.meshgrid(np.arange(5.), np.arange(4.))
+    assert helper(xd, yd)
+    # decreasing coordinates are not supported by pcolorfast's image path
+    assert not helper(xd[:, ::-1], yd)
+    # curvilinear grid, x varies along the ray axis
+    assert not helper(xd + 0.1 * yd, yd)
+    # 1D coordinates
+    assert not helper(np.arange(5.), np.arange(5.))
+
+
+def test_block_reduce():
+    helper = pyart.graph.radarmapdisplay_basemap._block_reduce
+    data = np.arange(24.).reshape(4, 6)
+    xd, yd = np.meshgrid(np.arange(7.), np.arange(5.))
+    rdata, rxd, ryd = helper(data, xd, yd, 2, 3)
+    assert rdata.shape == (2, 2)
+    assert np.allclose(rdata[0, 0], data[:2, :3].mean())
+    assert np.allclose(rdata[1, 1], data[2:, 3:].mean())
+    # every block_rays-th/block_gates-th corner is kept
+    assert rxd.shape == (3, 3)
+    assert np.allclose(rxd[0], [0., 3., 6.])
+    assert np.allclose(ryd[:, 0], [0., 2., 4.])
+
+
+def test_block_reduce_partial_blocks():
+    # trailing rays and gates which do not fill a block are dropped
+    helper = pyart.graph.radarmapdisplay_basemap._block_reduce
+    data = np.ones((5, 7))
+    xd, yd = np.meshgrid(np.arange(8.), np.arange(6.))
+    rdata, rxd, ryd = helper(data, xd, yd, 2, 3)
+    assert rdata.shape == (2, 2)
+    assert rxd.shape == (3, 3)
+    assert ryd.shape == (3, 3)
+
+
 if __name__ == "__main__":
     test_radarmapdisplay_ppi_basemap('figure_radarmapdisplay_ppi.png')